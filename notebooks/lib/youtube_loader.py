@@ -6,11 +6,20 @@ Local-first, YouTube-second strategy.
 """
 
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Callable, Iterator, Tuple
+import atexit
+import functools
 import json
 import logging
-from time import sleep
-from urllib.parse import urlparse, parse_qs
+import mmap
+import os
+import random
+import re
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from time import monotonic, sleep
 
 # -----------------------------------------------------------------------------
 # Logging
@@ -28,17 +37,68 @@ if not logger.handlers:
 # -----------------------------------------------------------------------------
 
 try:
+    import youtube_transcript_api
     from youtube_transcript_api import (
         YouTubeTranscriptApi,
         TranscriptsDisabled,
         NoTranscriptFound,
         CouldNotRetrieveTranscript,
     )
+    # Throttling / request failures worth retrying; names vary by release
+    # (TooManyRequests before 1.0, RequestBlocked/IpBlocked from 1.0)
+    _TRANSIENT_ERRORS = tuple(
+        getattr(youtube_transcript_api, name)
+        for name in ("YouTubeRequestFailed", "RequestBlocked", "TooManyRequests")
+        if hasattr(youtube_transcript_api, name)
+    )
     YT_AVAILABLE = True
 except ImportError:
     YT_AVAILABLE = False
     logger.warning("YouTubeTranscriptApi not installed. Live transcripts disabled.")
 
+# -----------------------------------------------------------------------------
+# Optional requests import (shared HTTP session)
+# -----------------------------------------------------------------------------
+
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# -----------------------------------------------------------------------------
+# Optional orjson import (stdlib json fallback)
+# -----------------------------------------------------------------------------
+
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _json_line(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def _json_line(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8") + b"\n"
+
+    _json_loads = json.loads
+
+# -----------------------------------------------------------------------------
+# Optional zstandard import (compressed transcripts)
+# -----------------------------------------------------------------------------
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
 # -----------------------------------------------------------------------------
 # Directory setup
 # -----------------------------------------------------------------------------
@@ -52,78 +112,288 @@ TRANSCRIPTS_DIR.mkdir(parents=True, exist_ok=True)
 # Video ID extractor
 # -----------------------------------------------------------------------------
 
+# Watch, short, embed, /v/, Shorts and live URLs all carry the 11-character ID
+_YT_ID_RE = re.compile(
+    r"(?:youtu\.be/|youtube\.com/(?:watch\?(?:.*&)?v=|embed/|v/|shorts/|live/))([A-Za-z0-9_-]{11})"
+)
+
+@functools.lru_cache(maxsize=4096)
 def extract_video_id(video_url_or_id: str) -> str:
     """Extract video ID from URL or return raw ID."""
-    if "youtube.com" not in video_url_or_id and "youtu.be" not in video_url_or_id:
-        return video_url_or_id.strip()
-
-    parsed = urlparse(video_url_or_id)
-
-    # Standard URL
-    if "youtube.com" in parsed.netloc:
-        params = parse_qs(parsed.query)
-        if "v" in params:
-            return params["v"][0]
-
-    # Short URL
-    if "youtu.be" in parsed.netloc:
-        return parsed.path.lstrip("/")
-
-    # Fallback
-    return parsed.path.strip("/").split("/")[-1]
+    m = _YT_ID_RE.search(video_url_or_id)
+    return m.group(1) if m else video_url_or_id.strip()
 
 # -----------------------------------------------------------------------------
 # Local transcript loading/saving
 # -----------------------------------------------------------------------------
 
+# Opt-in: the notebook reads data/transcripts/*.txt directly
+COMPRESS_TRANSCRIPTS = False
+ZSTD_LEVEL = 3
+
+# zstandard contexts must not be shared between threads
+_zstd_local = threading.local()
+
+def _zstd_compress(data: bytes) -> bytes:
+    if not hasattr(_zstd_local, "cctx"):
+        _zstd_local.cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL)
+    return _zstd_local.cctx.compress(data)
+
+def _zstd_decompress(data: bytes) -> bytes:
+    if not hasattr(_zstd_local, "dctx"):
+        _zstd_local.dctx = zstandard.ZstdDecompressor()
+    return _zstd_local.dctx.decompress(data)
+
+def _transcript_path(video_id: str) -> Path:
+    """Where save_local_transcript writes `video_id`."""
+    if COMPRESS_TRANSCRIPTS and ZSTD_AVAILABLE:
+        return TRANSCRIPTS_DIR / f"{video_id}.txt.zst"
+    return TRANSCRIPTS_DIR / f"{video_id}.txt"
+
+# Below this size a plain read() is cheaper than setting up a mapping
+MMAP_MIN_BYTES = 1 << 20
+
+def _decode_transcript(path: Path, data: Any) -> str:
+    if path.suffix == ".zst":
+        data = _zstd_decompress(data)
+    return str(data, "utf-8")
+
+@functools.lru_cache(maxsize=512)
+def _read_cached(path: Path, mtime_ns: int, size: int) -> str:
+    # mtime_ns and size are only part of the cache key: a rewritten file misses the cache
+    with path.open("rb") as f:
+        if size >= MMAP_MIN_BYTES:
+            # Decode straight from the page cache instead of copying into bytes first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _decode_transcript(path, mm)
+        return _decode_transcript(path, f.read())
+
+def _transcript_candidates(video_id: str) -> List[Path]:
+    """Files load_local_transcript tries for `video_id`, in order."""
+    candidates = [TRANSCRIPTS_DIR / f"{video_id}.txt"]
+    if ZSTD_AVAILABLE:
+        candidates.insert(0, TRANSCRIPTS_DIR / f"{video_id}.txt.zst")
+    return candidates
+
 def load_local_transcript(video_id: str) -> Optional[str]:
-    path = TRANSCRIPTS_DIR / f"{video_id}.txt"
-    if not path.exists():
-        return None
-    try:
-        return path.read_text(encoding="utf-8")
-    except Exception as e:
-        logger.error(f"Failed to read local transcript for {video_id}: {e}")
-        return None
+    for path in _transcript_candidates(video_id):
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        try:
+            return _read_cached(path, st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            logger.error(f"Failed to read local transcript for {video_id}: {e}")
+            return None
+    return None
+
+def list_local_transcripts() -> Dict[str, Path]:
+    """Map each saved video ID to its transcript file, from one directory scan."""
+    found: Dict[str, Path] = {}
+    with os.scandir(TRANSCRIPTS_DIR) as entries:
+        for e in entries:
+            if e.name.endswith(".txt"):
+                found.setdefault(e.name[:-4], Path(e.path))
+            elif ZSTD_AVAILABLE and e.name.endswith(".txt.zst"):
+                # Compressed copy wins, matching load_local_transcript
+                found[e.name[:-8]] = Path(e.path)
+    return found
+
+# Read once: os.umask can only be queried by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def save_local_transcript(video_id: str, text: str) -> Optional[Path]:
+    """
+    Write atomically so readers never see a torn or half-written file.
 
-def save_local_transcript(video_id: str, text: str) -> Path:
-    path = TRANSCRIPTS_DIR / f"{video_id}.txt"
+    Returns the saved path, or None if the write failed.
+    """
+    path = _transcript_path(video_id)
+    data = text.encode("utf-8")
+    if path.suffix == ".zst":
+        data = _zstd_compress(data)
+    tmp = None
     try:
-        path.write_text(text, encoding="utf-8")
+        # Unique temp name per writer: concurrent saves of one video cannot collide
+        fd, tmp = tempfile.mkstemp(dir=TRANSCRIPTS_DIR, prefix=f".{video_id}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            # mkstemp creates 0600; match what a plain open() would have given
+            os.fchmod(f.fileno(), 0o666 & ~_UMASK)
+            # Data must be on disk before the rename makes it visible
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
         return path
     except Exception as e:
         logger.error(f"Failed to save transcript for {video_id}: {e}")
-        return path
+        if tmp is not None:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+        return None
 
 # -----------------------------------------------------------------------------
 # YouTubeTranscriptApi wrapper
 # -----------------------------------------------------------------------------
 
-def fetch_youtube_transcript(video_id: str, languages: Optional[List[str]] = None) -> Optional[str]:
-    """Fetch transcript using YouTubeTranscriptApi (captions only)."""
-
-    if not YT_AVAILABLE:
-        return None
+# YouTubeTranscriptApi is not thread-safe and writes consent cookies onto
+# its session, so each worker thread gets its own API instance and session.
+# Connections are still kept alive across the fetches that thread makes.
+_thread_local = threading.local()
+# Weak so sessions of finished worker threads can be collected with them
+_sessions: "weakref.WeakSet[requests.Session]" = weakref.WeakSet()
+_sessions_lock = threading.Lock()
+
+def _close_sessions() -> None:
+    with _sessions_lock:
+        for session in list(_sessions):
+            session.close()
+
+atexit.register(_close_sessions)
+
+def get_session() -> "requests.Session":
+    """Keep-alive HTTP session for the calling thread, created on first use."""
+    if not REQUESTS_AVAILABLE:
+        raise RuntimeError("get_session() requires the 'requests' package")
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+        with _sessions_lock:
+            _sessions.add(session)
+    return session
+
+def _get_api() -> "YouTubeTranscriptApi":
+    api = getattr(_thread_local, "api", None)
+    if api is None:
+        api = _thread_local.api = YouTubeTranscriptApi(http_client=get_session())
+    return api
+
+def _get_segments(video_id: str, languages: List[str]) -> List[Dict[str, Any]]:
+    # youtube-transcript-api >= 1.0 takes an injected session; older releases
+    # only expose the classmethod, which opens a new connection per call
+    if hasattr(YouTubeTranscriptApi, "fetch"):
+        return _get_api().fetch(video_id, languages=languages).to_raw_data()
+    return YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
+
+class TokenBucket:
+    """
+    Thread-safe rate limiter, shared by every worker it is handed to.
 
-    if languages is None:
-        languages = ["en", "en-US"]
+    Allows bursts of up to `capacity` calls, then refills one token every
+    `interval` seconds. A caller that finds the bucket empty reserves the
+    next token and sleeps until it is due, so concurrent workers queue up
+    instead of all firing at once.
+    """
 
+    def __init__(self, interval: float, capacity: int) -> None:
+        self.interval = interval
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._tokens = float(capacity)
+        self._stamp = monotonic()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = monotonic()
+            if self.interval <= 0:
+                self._tokens = float(self.capacity)
+            else:
+                refill = (now - self._stamp) / self.interval
+                self._tokens = min(float(self.capacity), self._tokens + refill)
+            self._stamp = now
+            self._tokens -= 1
+            wait = -self._tokens * self.interval if self._tokens < 0 else 0.0
+        if wait > 0:
+            sleep(wait)
+
+FETCH_MAX_ATTEMPTS = 6
+FETCH_BACKOFF_INITIAL = 1.0
+FETCH_BACKOFF_MAX = 60.0
+
+def _http_response(exc: BaseException) -> Optional[Any]:
+    """Return the HTTP response of the requests error chained behind `exc`, if any."""
+    seen = set()
+    while exc is not None and id(exc) not in seen:
+        seen.add(id(exc))
+        response = getattr(exc, "response", None)
+        if response is not None:
+            return response
+        exc = exc.__cause__ or exc.__context__
+    return None
+
+def _retry_after_seconds(response: Any) -> Optional[float]:
+    """Retry-After in seconds, clamped to [0, FETCH_BACKOFF_MAX]."""
     try:
-        segments = YouTubeTranscriptApi.get_transcript(video_id, languages=languages)
+        delay = float(response.headers.get("Retry-After"))
+    except (TypeError, ValueError):
+        # Missing or HTTP-date form — fall back to exponential backoff
+        return None
+    if not delay >= 0.0:
+        # Negative or NaN
+        return 0.0
+    return min(delay, FETCH_BACKOFF_MAX)
+
+def fetch_youtube_transcript(
+    video_id: str,
+    languages: Optional[List[str]] = None,
+    *,
+    rate_limiter: Optional[TokenBucket] = None
+) -> Optional[str]:
+    """
+    Fetch transcript using YouTubeTranscriptApi (captions only).
 
-        text = "\n".join(
-            s.get("text", "").strip()
-            for s in segments
-            if s.get("text", "").strip()
-        )
+    Transient failures (throttling, blocked requests, 5xx responses) are
+    retried with exponential backoff and jitter, honouring a Retry-After
+    header when the underlying HTTP error carries one. Every other failure
+    returns None immediately.
 
-        return text if text else None
+    If `rate_limiter` is given, every attempt (retries included) takes a
+    token from it first.
+    """
 
-    except (TranscriptsDisabled, NoTranscriptFound, CouldNotRetrieveTranscript):
-        return None
-    except Exception:
+    if not YT_AVAILABLE:
         return None
 
+    if languages is None:
+        languages = ["en", "en-US"]
+
+    for attempt in range(1, FETCH_MAX_ATTEMPTS + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            segments = _get_segments(video_id, languages)
+            break
+        except _TRANSIENT_ERRORS as e:
+            # YouTubeRequestFailed wraps every HTTPError; only server errors
+            # and 429 are worth another attempt
+            response = _http_response(e)
+            status = getattr(response, "status_code", None)
+            if status is not None and status < 500 and status != 429:
+                return None
+            if attempt == FETCH_MAX_ATTEMPTS:
+                logger.warning(f"Giving up on {video_id} after {attempt} attempts: {type(e).__name__}")
+                return None
+            # Only wrapped HTTP errors carry headers: in youtube-transcript-api
+            # 1.x a 429 raises IpBlocked with no response, so it always backs off
+            delay = _retry_after_seconds(response) if response is not None else None
+            if delay is None:
+                delay = min(FETCH_BACKOFF_MAX, FETCH_BACKOFF_INITIAL * 2 ** (attempt - 1))
+                delay += random.uniform(0, FETCH_BACKOFF_INITIAL)
+            logger.info(f"Retrying {video_id} in {delay:.1f}s ({type(e).__name__})")
+            sleep(delay)
+        except (TranscriptsDisabled, NoTranscriptFound, CouldNotRetrieveTranscript):
+            # Permanent: disabled, missing, unavailable, age-restricted, ...
+            return None
+        except Exception:
+            return None
+
+    # Strip each segment once; empty captions are dropped
+    return "\n".join([t for s in segments if (t := s.get("text", "").strip())]) or None
+
 # -----------------------------------------------------------------------------
 # Unified transcript loader
 # -----------------------------------------------------------------------------
@@ -133,7 +403,8 @@ def get_or_create_transcript(
     *,
     use_youtube_fallback: bool = True,
     save_downloaded: bool = True,
-    languages: Optional[List[str]] = None
+    languages: Optional[List[str]] = None,
+    rate_limiter: Optional[TokenBucket] = None
 ) -> Tuple[Optional[str], Dict[str, Any]]:
     """
     Strategy:
@@ -156,12 +427,11 @@ def get_or_create_transcript(
 
     # 2 — YouTube
     if use_youtube_fallback:
-        yt = fetch_youtube_transcript(video_id, languages=languages)
+        yt = fetch_youtube_transcript(video_id, languages=languages, rate_limiter=rate_limiter)
         if yt:
             meta["source"] = "youtube"
             if save_downloaded:
-                save_local_transcript(video_id, yt)
-                meta["saved_locally"] = True
+                meta["saved_locally"] = save_local_transcript(video_id, yt) is not None
             return yt, meta
 
     return None, meta
@@ -170,98 +440,187 @@ def get_or_create_transcript(
 # Curated collections
 # -----------------------------------------------------------------------------
 
-curated_videos: Dict[str, List[Dict[str, str]]] = {
-    "african_cuisine": [
-        {"title": "Nigerian Efo Riro", "url": "https://youtu.be/vIIyn8LH1_E"},
-        {"title": "Nigerian Moi-Moi", "url": "https://youtu.be/8ACC_oqhQRQ"},
-        {"title": "Ghanaian Kontomire Stew", "url": "https://youtu.be/6VXYzN_gDNs"},
-        {"title": "South African Chakalaka", "url": "https://youtu.be/FiiTy8FpxqY"},
-    ],
-    "french_cuisine": [
-        {"title": "Flognarde Dessert", "url": "https://youtu.be/Q5uBEWjNeTw"},
-        {"title": "Coq au Vin", "url": "https://youtu.be/GFuBsSrIVaE"},
-        {"title": "Poulet au Vinaigre", "url": "https://youtu.be/tOgH_ElyGQg"},
-        {"title": "Ratatouille", "url": "https://youtu.be/9qCO2qKrfr4"},
-    ],
-    "portuguese_cuisine": [
-        {"title": "Bacalhau", "url": "https://youtu.be/xuUelAOuH3o"},
-        {"title": "Carne Estufada", "url": "https://youtu.be/4sRwu9BnLAU"},
-        {"title": "Pastel de Nata", "url": "https://youtu.be/MA4LEjxZ7io"},
-        {"title": "Bifanas", "url": "https://youtu.be/2PoVTipLxoI"},
-    ],
-    "jamaican_cuisine": [
-        {"title": "Pork Shoulder", "url": "https://youtu.be/d6IKVNRDjUk"},
-        {"title": "Jamaican Curry Chicken", "url": "https://youtu.be/QIG6weWWB4Q"},
-        {"title": "Sweet and Sour Fish", "url": "https://youtu.be/RlZx52eyW4M"},
-        {"title": "Rice and Peas", "url": "https://youtu.be/qHC2WBx8Cvg"},
-    ],
-    "syrian_cuisine": [
-        {"title": "Shrakiye", "url": "https://youtu.be/tB5XsB91-fQ"},
-        {"title": "Tabouleh", "url": "https://youtu.be/HMXByWj_TAY"},
-        {"title": "Knafe Nabulsieh", "url": "https://youtu.be/DJD4QQkItT4"},
-        {"title": "Fatteh", "url": "https://youtu.be/xF4XRASGaC0"},
-    ],
-    "italian_cuisine": [
-        {"title": "Chicken Cacciatore", "url": "https://youtu.be/bGJMHjG85BM"},
-        {"title": "Cannelloni", "url": "https://youtu.be/E--DfY3w15k"},
-        {"title": "Zozzona", "url": "https://youtu.be/WttUeyXPCbU"},
-        {"title": "Gnocchi alla Sorrentina", "url": "https://youtu.be/llV1kYg5zNo"},
-    ],
-    "indian_cuisine": [
-        {"title": "Chana Masala", "url": "https://youtu.be/PRw88q0NkiY"},
-        {"title": "Chilli Garlic Tawa Chicken", "url": "https://youtu.be/nilVmkdmabs"},
-        {"title": "Coconut Dosa", "url": "https://youtu.be/s6h3b4tuhCE"},
-        {"title": "Garlic Naan Bread", "url": "https://youtu.be/wmbpOb9neLY"},
-    ],
-}
+CURATED_VIDEOS_PATH = Path(__file__).with_name("curated_videos.json")
+
+@functools.cache
+def get_curated_videos() -> Dict[str, List[Dict[str, str]]]:
+    """Curated collections, read from curated_videos.json on first use."""
+    return _json_loads(CURATED_VIDEOS_PATH.read_bytes())
+
+def __getattr__(name: str) -> Any:
+    # Keeps `youtube_loader.curated_videos` working without loading it at import
+    if name == "curated_videos":
+        return get_curated_videos()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # -----------------------------------------------------------------------------
 # Bulk preload
 # -----------------------------------------------------------------------------
 
+# (collection, title, url, video_id)
+CuratedJob = Tuple[str, str, str, str]
+
+def _flatten_curated(curated_map: Dict[str, List[Dict[str, str]]]) -> List[CuratedJob]:
+    jobs: List[CuratedJob] = []
+    for collection, videos in curated_map.items():
+        for v in videos:
+            url = v["url"]
+            jobs.append((collection, v.get("title", ""), url, extract_video_id(url)))
+    return jobs
+
+def _build_index_entry(
+    job: CuratedJob,
+    *,
+    existing: Dict[str, Path],
+    use_youtube_fallback: bool,
+    rate_limiter: TokenBucket,
+) -> Dict[str, Any]:
+    """Load (or fetch) one curated video and describe it for the index."""
+    collection, title, url, video_id = job
+
+    path = existing.get(video_id)
+    if path is not None:
+        # Already on disk — no fetch, so no reason to throttle
+        source = "local"
+    else:
+        transcript, meta = get_or_create_transcript(
+            url,
+            use_youtube_fallback=use_youtube_fallback,
+            save_downloaded=True,
+            rate_limiter=rate_limiter,
+        )
+        source = meta["source"]
+
+        if meta["saved_locally"]:
+            path = _transcript_path(video_id)
+        elif source == "local":
+            # Saved after the directory snapshot was taken
+            path = next((p for p in _transcript_candidates(video_id) if p.exists()), None)
+
+    return {
+        "collection": collection,
+        "title": title,
+        "url": url,
+        "video_id": video_id,
+        "transcript_source": source,
+        "transcript_path": str(path) if path else None,
+    }
+
+IndexEntryBuilder = Callable[[CuratedJob], Dict[str, Any]]
+
+def _preload_threaded(
+    jobs: List[CuratedJob],
+    build: IndexEntryBuilder,
+    max_concurrency: int,
+) -> List[Dict[str, Any]]:
+    """
+    Run every curated fetch on a pool of `max_concurrency` threads.
+
+    YouTubeTranscriptApi is blocking, so threads give the concurrency; this
+    also works inside the notebook's already-running event loop.
+    """
+
+    # Slots keep the index in curated order regardless of completion order
+    index: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as ex:
+        futures = {
+            ex.submit(build, job): pos
+            for pos, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            index[futures[future]] = future.result()
+
+    return index
+
+def _iter_journal(path: Path) -> Iterator[Dict[str, Any]]:
+    """Stream entries from a preload checkpoint journal (JSON Lines)."""
+    if not path.exists():
+        return
+    with path.open("rb") as f:
+        for line in f:
+            try:
+                yield _json_loads(line)
+            except ValueError:
+                # Blank or torn last line from an interrupted run
+                continue
+
 def preload_curated_transcripts(
-    curated_map: Dict[str, List[Dict[str, str]]],
+    curated_map: Optional[Dict[str, List[Dict[str, str]]]] = None,
     *,
     use_youtube_fallback: bool = True,
-    delay_seconds: float = 1.5
+    delay_seconds: float = 1.5,
+    burst: int = 4,
+    max_concurrency: int = 8
 ) -> List[Dict[str, Any]]:
+    """
+    Fetch every curated transcript concurrently and write curated_index.json.
 
-    index: List[Dict[str, Any]] = []
+    Defaults to the bundled curated collections (see get_curated_videos).
 
-    for collection, videos in curated_map.items():
-        logger.info(f"Processing: {collection} ({len(videos)} videos)")
+    Videos already on disk are indexed without touching the network.
+    Every YouTube request, retries included, takes a token from one bucket
+    shared by all workers: up to `burst` may start at once, after which
+    they average one per `delay_seconds`, so raising `max_concurrency`
+    does not raise the request rate.
 
-        for v in videos:
-            url = v["url"]
-            title = v.get("title", "")
+    Each entry is checkpointed to curated_index.jsonl as soon as it is
+    built; an interrupted run resumes from there and the journal is removed
+    once curated_index.json has been written.
+    """
 
-            transcript, meta = get_or_create_transcript(
-                url,
-                use_youtube_fallback=use_youtube_fallback,
-                save_downloaded=True,
-            )
+    if curated_map is None:
+        curated_map = get_curated_videos()
+
+    jobs = _flatten_curated(curated_map)
 
-            video_id = meta["video_id"]
+    for collection, videos in curated_map.items():
+        logger.info(f"Processing: {collection} ({len(videos)} videos)")
+
+    journal_path = DATA_DIR / "curated_index.jsonl"
+    done = {
+        (e["collection"], e["video_id"]): e
+        for e in _iter_journal(journal_path)
+        if e.get("transcript_path")
+    }
+    if done:
+        logger.info(f"Resuming from {journal_path} ({len(done)} entries already done)")
 
-            path = TRANSCRIPTS_DIR / f"{video_id}.txt"
-            if not path.exists():
-                path = None
+    index = [done.get((job[0], job[3])) for job in jobs]
+    pending = [pos for pos, entry in enumerate(index) if entry is None]
 
-            entry = {
-                "collection": collection,
-                "title": title,
-                "url": url,
-                "video_id": video_id,
-                "transcript_source": meta["source"],
-                "transcript_path": str(path) if path else None,
-            }
+    existing = list_local_transcripts()
+    rate_limiter = TokenBucket(delay_seconds, burst)
+    journal_lock = threading.Lock()
 
-            index.append(entry)
+    with journal_path.open("ab", buffering=0) as journal:
 
-            sleep(delay_seconds)
+        def build(job: CuratedJob) -> Dict[str, Any]:
+            entry = _build_index_entry(
+                job,
+                existing=existing,
+                use_youtube_fallback=use_youtube_fallback,
+                rate_limiter=rate_limiter,
+            )
+            with journal_lock:
+                journal.write(_json_line(entry))
+            return entry
+
+        # Fetch each video once, even if it appears in several collections
+        first: Dict[str, int] = {}
+        for pos in pending:
+            first.setdefault(jobs[pos][3], pos)
+        unique = list(first.values())
+        results = _preload_threaded([jobs[pos] for pos in unique], build, max_concurrency)
+
+    by_id = {jobs[pos][3]: entry for pos, entry in zip(unique, results)}
+    for pos in pending:
+        collection, title, url, video_id = jobs[pos]
+        index[pos] = {**by_id[video_id], "collection": collection, "title": title, "url": url}
 
     index_path = DATA_DIR / "curated_index.json"
-    index_path.write_text(json.dumps(index, indent=2), encoding="utf-8")
+    index_path.write_bytes(_json_dumps(index))
+    journal_path.unlink()
 
     logger.info(f"Saved curated index ({len(index)} entries) → {index_path}")
 
@@ -276,4 +635,4 @@ def load_curated_index() -> List[Dict[str, Any]]:
     if not path.exists():
         logger.error("curated_index.json not found — run preload_curated_transcripts() first.")
         return []
-    return json.loads(path.read_text(encoding="utf-8")) 
\ No newline at end of file
+    return _json_loads(path.read_bytes()) 
\ No newline at end of file